@@ -1,82 +1,45 @@
-try:
-    import requests
-except ImportError:
-    import urequests as requests
-
-from base64 import b64encode
-
-# IDs of CrateDB supported data types.
-# https://cratedb.com/docs/crate/reference/en/latest/interfaces/http.html#id4
-CRATEDB_TYPE_NULL = 0
-CRATEDB_TYPE_NOT_SUPPORTED = 1
-CRATEDB_TYPE_CHAR = 2
-CRATEDB_TYPE_BOOLEAN = 3
-CRATEDB_TYPE_TEXT = 4
-CRATEDB_TYPE_IP = 5
-CRATEDB_TYPE_DOUBLE_PRECISION = 6
-CRATEDB_TYPE_REAL = 7
-CRATEDB_TYPE_SMALLINT = 8
-CRATEDB_TYPE_INTEGER = 9
-CRATEDB_TYPE_BIGINT = 10
-CRATEDB_TYPE_TIMESTAMP_WITH_TIME_ZONE = 11
-CRATEDB_TYPE_OBJECT = 12
-CRATEDB_TYPE_GEO_POINT = 13
-CRATEDB_TYPE_GEO_SHAPE = 14
-CRATEDB_TYPE_TIMESTAMP_WITHOUT_TIME_ZONE = 15
-CRATEDB_TYPE_UNCHECKED_OBJECT = 16
-CRATEDB_TYPE_INTERVAL = 17
-CRATEDB_TYPE_REGPROC = 19
-CRATEDB_TYPE_TIME = 20
-CRATEDB_TYPE_OIDVECTOR = 21
-CRATEDB_TYPE_NUMERIC = 22
-CRATEDB_TYPE_REGCLASS = 23
-CRATEDB_TYPE_DATE = 24
-CRATEDB_TYPE_BIT = 25
-CRATEDB_TYPE_JSON = 26
-CRATEDB_TYPE_CHARACTER = 27
-CRATEDB_TYPE_FLOAT_VECTOR = 28
-CRATEDB_TYPE_ARRAY = 100
-
-# CrateDB error codes.
-# https://cratedb.com/docs/crate/reference/en/latest/interfaces/http.html#error-codes
-CRATEDB_ERROR_INVALID_SYNTAX = 4000
-CRATEDB_ERROR_INVALID_ANALYZER = 4001
-CRATEDB_ERROR_INVALID_RELATION_NAME = 4002
-CRATEDB_ERROR_FIELD_TYPE_VALIDATION_FAILED = 4003
-CRATEDB_ERROR_FEATURE_UNSUPPORTED = 4004
-CRATEDB_ERROR_ALTER_TABLE_WITH_ALIAS_UNSUPPORTED = 4005
-CRATEDB_ERROR_COLUMN_ALIAS_AMBIGUOUS = 4006
-CRATEDB_ERROR_OPERATION_NOT_SUPPORTED_ON_RELATION = 4007
-CRATEDB_ERROR_INVALID_COLUMN_NAME = 4008
-CRATEDB_ERROR_USER_NOT_AUTHORIZED = 4010
-CRATEDB_ERROR_MISSING_USER_PRIVILEGE = 4011
-CRATEDB_ERROR_NODE_READ_ONLY = 4031
-CRATEDB_ERROR_UNKNOWN_RELATION = 4041
-CRATEDB_ERROR_UNKNOWN_ANALYZER = 4042
-CRATEDB_ERROR_UNKNOWN_COLUMN = 4043
-CRATEDB_ERROR_UNKNOWN_TYPE = 4044
-CRATEDB_ERROR_UNKNOWN_SCHEMA = 4045
-CRATEDB_ERROR_UNKNOWN_PARTITION = 4046
-CRATEDB_ERROR_UNKNOWN_REPOSITORY = 4047
-CRATEDB_ERROR_UNKNOWN_SNAPSHOT = 4048
-CRATEDB_ERROR_UNKNOWN_FUNCTION = 4049
-CRATEDB_ERROR_UNKNOWN_USER = 40410
-CRATEDB_ERROR_DOCUMENT_EXISTS = 4091
-CRATEDB_ERROR_VERSION_CONFLICT = 4092
-CRATEDB_ERROR_RELATION_EXISTS = 4093
-CRATEDB_ERROR_TABLE_ALIAS_SCHEMA_DIFFERS = 4094
-CRATEDB_ERROR_REPOSITORY_EXISTS = 4095
-CRATEDB_ERROR_SNAPSHOT_EXISTS = 4096
-CRATEDB_ERROR_PARTITION_EXISTS = 4097
-CRATEDB_ERROR_FUNCTION_EXISTS = 4098
-CRATEDB_ERROR_USER_EXISTS = 4099
-CRATEDB_ERROR_OBJECT_EXISTS = 4100
-CRATEDB_ERROR_UNHANDLED_SERVER_ERROR = 5000
-CRATEDB_ERROR_TASK_EXECUTION_FAILED = 5001
-CRATEDB_ERROR_SHARDS_UNAVAILABLE = 5002
-CRATEDB_ERROR_QUERY_FAILED_ON_SHARDS = 5003
-CRATEDB_ERROR_SNAPSHOT_CREATION_FAILED = 5004
-CRATEDB_ERROR_QUERY_KILLED = 5030
+# Dependencies are imported on first use, to keep import time and heap
+# usage low on MicroPython. See `_get_requests()` and `__getattr__()`.
+_requests = None
+
+
+def _get_requests():
+    global _requests
+    if _requests is None:
+        try:
+            import requests
+        except ImportError:
+            import urequests as requests
+        _requests = requests
+    return _requests
+
+
+def __getattr__(name):
+    # `CRATEDB_TYPE_*` and `CRATEDB_ERROR_*` constants live in
+    # `cratedb_constants`, and `UpsertBuffer` in `cratedb_upsert`.
+    # Both are only loaded when first needed.
+    if name.startswith("CRATEDB_"):
+        import cratedb_constants
+
+        return getattr(cratedb_constants, name)
+    if name == "UpsertBuffer":
+        from cratedb_upsert import UpsertBuffer
+
+        return UpsertBuffer
+    raise AttributeError(name)
+
+
+def __dir__():
+    # List the lazily loaded names too. This loads `cratedb_constants`.
+    import cratedb_constants
+
+    names = [name for name in dir(cratedb_constants) if name.startswith("CRATEDB_")]
+    return sorted(list(globals()) + names + ["UpsertBuffer"])
+
+
+# `rowcount` reported by CrateDB for a failed row in a bulk operation.
+# https://cratedb.com/docs/crate/reference/en/latest/interfaces/http.html#bulk-errors
+BULK_ROW_FAILED = -2
 
 
 class NetworkError(Exception):
@@ -104,6 +67,8 @@ class CrateDB:
             self.encoded_credentials = self.__encode_credentials(self.user, self.password)
 
     def __encode_credentials(self, user, password):
+        from base64 import b64encode
+
         creds_str = f"{user}:{password}"
         return b64encode(creds_str.encode("UTF-8")).decode("UTF-8")
 
@@ -129,7 +94,7 @@ class CrateDB:
                 payload["bulk_args"] = args
 
         try:
-            response = requests.post(request_url, headers=headers, json=payload)  # noqa: S113
+            response = _get_requests().post(request_url, headers=headers, json=payload)  # noqa: S113
         except OSError as o:
             raise NetworkError(o)  # noqa: B904
 
@@ -151,3 +116,15 @@ class CrateDB:
 
     def execute(self, sql, args=None, with_types=False, return_response=True):
         return self.__make_request(sql, args, with_types, return_response)
+
+
+if __name__ == "__main__":
+    # `python -m cratedb` runs the import / export command-line tool. This
+    # only works on CPython: `cratedb_cli` is not installed on devices. It
+    # imports `cratedb` again under its own name, which is intended: the
+    # tool uses that copy, and nothing from this `__main__` module.
+    import sys
+
+    from cratedb_cli import main
+
+    sys.exit(main())
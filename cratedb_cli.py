@@ -0,0 +1,410 @@
+# Command-line tool for streaming data out of and into CrateDB, invoked
+# as `python -m cratedb`. This module is meant for CPython and is not
+# installed on devices by `mip`.
+#
+# Export a query to JSON lines or CSV, page by page:
+#
+#   python -m cratedb --host localhost --no-ssl export \
+#     "SELECT * FROM temp_humidity ORDER BY ts" temp_humidity.jsonl
+#
+# Import JSON lines or CSV in batches, using several parallel requests:
+#
+#   python -m cratedb --host localhost --no-ssl import \
+#     temp_humidity temp_humidity.jsonl --parallelism 4
+#
+# Each command records its last committed offset in `<file>.export.offset`
+# or `<file>.import.offset`, and continues from there when invoked with
+# `--resume`. Rows that CrateDB rejects during an import are written to
+# `<file>.import.rejects`, together with their offset and bulk result.
+#
+# In CSV files, NULL is written as `\N`, and booleans, OBJECT and ARRAY
+# values as JSON text. Text values starting with `\`, `{` or `[` are
+# escaped with a leading `\`, so they are not mistaken for either. Other
+# values are imported as text, and cast to the column type by CrateDB.
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import cratedb
+
+FORMATS = ("jsonl", "csv")
+
+# Marker for NULL values in CSV files, as used by PostgreSQL's `COPY`.
+CSV_NULL = "\\N"
+
+
+class Progress:
+    def __init__(self, verb, offset=0, out=None):
+        self.verb = verb
+        self.start_offset = offset
+        self.offset = offset
+        self.started = time.monotonic()
+        self.out = out or sys.stderr
+
+    def rate(self):
+        elapsed = time.monotonic() - self.started
+        if elapsed <= 0:
+            return 0.0
+        return (self.offset - self.start_offset) / elapsed
+
+    def update(self, offset, rejected=0):
+        self.offset = offset
+        done = self.offset - rejected
+        status = f"{done} rows, {rejected} rejected" if rejected else f"{done} rows"
+        self.out.write(f"\r{self.verb} {status} ({self.rate():.1f} rows/s)")
+        self.out.flush()
+
+    def done(self):
+        self.out.write("\n")
+        self.out.flush()
+
+
+def guess_format(path, fmt=None):
+    if fmt is not None:
+        return fmt
+    if path.endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+
+def offset_path(path, command):
+    return f"{path}.{command}.offset"
+
+
+def rejects_path(path):
+    return f"{path}.import.rejects"
+
+
+def read_offset(path, command):
+    try:
+        with open(offset_path(path, command)) as f:
+            offset = json.load(f).get("offset")
+    except FileNotFoundError:
+        return 0
+    except (AttributeError, ValueError):
+        offset = None
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError(f"Invalid offset file {offset_path(path, command)}")
+    return offset
+
+
+def write_offset(path, command, offset):
+    # Write to a temporary file first, so an interrupted run never leaves
+    # a truncated offset file behind.
+    tmp_path = f"{offset_path(path, command)}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"offset": offset}, f)
+    os.replace(tmp_path, offset_path(path, command))
+
+
+def encode_csv_value(value):
+    if value is None:
+        return CSV_NULL
+    if isinstance(value, (bool, dict, list)):
+        return json.dumps(value)
+    if isinstance(value, str) and value[:1] in ("\\", "{", "["):
+        return f"\\{value}"
+    return value
+
+
+def decode_csv_value(value):
+    if value == CSV_NULL:
+        return None
+    if value[:1] == "\\":
+        return value[1:]
+    if value[:1] in ("{", "["):
+        return json.loads(value)
+    return value
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return number
+
+
+def format_error(e):
+    if isinstance(e, cratedb.CrateDBError) and isinstance(e.args[0], dict):
+        error = e.args[0].get("error", {})
+        return f"CrateDB error {error.get('code')}: {error.get('message')}"
+    if isinstance(e, OSError) and e.filename is not None:
+        return f"{type(e).__name__}: {e.strerror}: {e.filename}"
+    return f"{type(e).__name__}: {e}"
+
+
+def export_rows(crate, query, path, fmt=None, page_size=1000, resume=False, out=None):
+    """
+    Stream the rows of `query` into `path`, one page of `page_size` rows at a
+    time, using `LIMIT` / `OFFSET`. The query should have an `ORDER BY` clause
+    so that pages are stable, and must not have its own `LIMIT` / `OFFSET`.
+
+    Returns the number of rows written by this invocation.
+    """
+    fmt = guess_format(path, fmt)
+    offset = read_offset(path, "export") if resume else 0
+    sql = f"{query.strip().rstrip(';')} LIMIT ? OFFSET ?"
+    progress = Progress("Exported", offset, out)
+
+    with open(path, "a" if offset > 0 else "w", newline="") as f:
+        writer = csv.writer(f) if fmt == "csv" else None
+        while True:
+            response = crate.execute(sql, [page_size, offset])
+            rows = response["rows"]
+
+            if writer is not None:
+                if offset == 0:
+                    writer.writerow(response["cols"])
+                for row in rows:
+                    writer.writerow(encode_csv_value(v) for v in row)
+            else:
+                cols = response["cols"]
+                for row in rows:
+                    f.write(json.dumps(dict(zip(cols, row))))
+                    f.write("\n")
+
+            f.flush()
+            offset += len(rows)
+            write_offset(path, "export", offset)
+            progress.update(offset)
+
+            if len(rows) < page_size:
+                break
+
+    progress.done()
+    return offset - progress.start_offset
+
+
+def read_records(path, fmt, columns=None):
+    """
+    Yield `(columns, values)` for each record in `path`.
+    """
+    with open(path, newline="") as f:
+        if fmt == "csv":
+            reader = csv.reader(f)
+            header = next(reader, None)
+            for values in reader:
+                try:
+                    values = [decode_csv_value(v) for v in values]
+                except ValueError as e:
+                    raise ValueError(f"{path}, line {reader.line_num}: {e}") from e
+                yield columns or header, values
+        else:
+            for line_num, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}, line {line_num}: {e}") from e
+                cols = columns or list(record)
+                yield cols, [record.get(c) for c in cols]
+
+
+def read_batches(path, fmt, batch_size, skip=0, columns=None):
+    """
+    Yield `(columns, rows)` batches of at most `batch_size` rows, skipping the
+    first `skip` records. A new batch is started whenever the set of columns
+    changes between JSON lines records.
+    """
+    batch_cols, batch = None, []
+    for i, (cols, values) in enumerate(read_records(path, fmt, columns)):
+        if i < skip:
+            continue
+        if batch and (cols != batch_cols or len(batch) >= batch_size):
+            yield batch_cols, batch
+            batch = []
+        batch_cols = cols
+        batch.append(values)
+    if batch:
+        yield batch_cols, batch
+
+
+def insert_batch(crate, table, columns, rows):
+    """
+    Insert `rows` into `table` with a single bulk request, and return
+    `(index, result)` for each row CrateDB reported as failed.
+    """
+    placeholders = ", ".join("?" for _ in columns)
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    response = crate.execute(
+        f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})", rows
+    )
+    return [
+        (i, result)
+        for i, result in enumerate(response["results"])
+        if result["rowcount"] == cratedb.BULK_ROW_FAILED
+    ]
+
+
+def import_rows(
+    crate,
+    table,
+    path,
+    fmt=None,
+    batch_size=1000,
+    parallelism=1,
+    columns=None,
+    resume=False,
+    out=None,
+):
+    """
+    Stream records from `path` into `table` as batched `bulk_args` requests,
+    running up to `parallelism` requests at once.
+
+    The committed offset only moves past a batch once it and every batch
+    before it have completed, so `resume` never skips records that were not
+    sent. Rows CrateDB rejects are not retried on `resume`: each one is
+    appended to `<file>.import.rejects` as a JSON line holding its `offset`
+    in the file, the `row`, and the bulk `result`.
+
+    Returns `(imported, rejected)` row counts for this invocation.
+    """
+    fmt = guess_format(path, fmt)
+    offset = read_offset(path, "import") if resume else 0
+    progress = Progress("Imported", offset, out)
+    rejected = 0
+
+    # Batch start offset -> (columns, rows, future), in submission order.
+    pending = {}
+    committed = offset
+
+    def commit_done():
+        nonlocal committed, rejected
+        while committed in pending and pending[committed][2].done():
+            cols, rows, future = pending.pop(committed)
+            failures = future.result()
+            for i, result in failures:
+                rejects.write(
+                    json.dumps(
+                        {
+                            "offset": committed + i,
+                            "row": dict(zip(cols, rows[i])),
+                            "result": result,
+                        }
+                    )
+                )
+                rejects.write("\n")
+            rejects.flush()
+            rejected += len(failures)
+            committed += len(rows)
+            write_offset(path, "import", committed)
+            progress.update(committed, rejected)
+
+    with (
+        open(rejects_path(path), "a" if resume else "w") as rejects,
+        ThreadPoolExecutor(max_workers=parallelism) as executor,
+    ):
+        try:
+            next_offset = offset
+            for cols, rows in read_batches(path, fmt, batch_size, offset, columns):
+                # Bound the number of batches held in memory, by waiting for
+                # the oldest one, which is the only one that can be committed.
+                while len(pending) >= parallelism * 2:
+                    wait([pending[committed][2]])
+                    commit_done()
+                future = executor.submit(insert_batch, crate, table, cols, rows)
+                pending[next_offset] = (cols, rows, future)
+                next_offset += len(rows)
+                commit_done()
+
+            wait([p[2] for p in pending.values()])
+            commit_done()
+        finally:
+            for _, _, future in pending.values():
+                future.cancel()
+
+    progress.done()
+    return committed - progress.start_offset - rejected, rejected
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m cratedb",
+        description="Stream data between CrateDB and JSON lines or CSV files.",
+    )
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=4200)
+    parser.add_argument("--user")
+    parser.add_argument(
+        "--password",
+        default=os.environ.get("CRATEDB_PASSWORD"),
+        help="defaults to the CRATEDB_PASSWORD environment variable",
+    )
+    parser.add_argument("--schema", default="doc")
+    parser.add_argument("--no-ssl", dest="use_ssl", action="store_false")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="export a query to a file")
+    export_parser.add_argument("query", help="SELECT statement, ideally with ORDER BY")
+    export_parser.add_argument("file")
+    export_parser.add_argument("--format", choices=FORMATS)
+    export_parser.add_argument("--page-size", type=positive_int, default=1000)
+    export_parser.add_argument("--resume", action="store_true")
+
+    import_parser = commands.add_parser("import", help="import a file into a table")
+    import_parser.add_argument("table")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--format", choices=FORMATS)
+    import_parser.add_argument("--batch-size", type=positive_int, default=1000)
+    import_parser.add_argument("--parallelism", type=positive_int, default=1)
+    import_parser.add_argument(
+        "--columns", help="comma separated column names, overriding the file's own"
+    )
+    import_parser.add_argument("--resume", action="store_true")
+
+    return parser
+
+
+def main(argv=None):
+    args = make_parser().parse_args(argv)
+
+    crate = cratedb.CrateDB(
+        host=args.host,
+        port=args.port,
+        user=args.user,
+        password=args.password,
+        schema=args.schema,
+        use_ssl=args.use_ssl,
+    )
+
+    try:
+        if args.command == "export":
+            export_rows(
+                crate,
+                args.query,
+                args.file,
+                fmt=args.format,
+                page_size=args.page_size,
+                resume=args.resume,
+            )
+        else:
+            _, rejected = import_rows(
+                crate,
+                args.table,
+                args.file,
+                fmt=args.format,
+                batch_size=args.batch_size,
+                parallelism=args.parallelism,
+                columns=args.columns.split(",") if args.columns else None,
+                resume=args.resume,
+            )
+            if rejected:
+                sys.stderr.write(
+                    f"{rejected} rows rejected, see {rejects_path(args.file)}\n"
+                )
+                return 1
+    except (cratedb.NetworkError, cratedb.CrateDBError, OSError, ValueError) as e:
+        sys.stderr.write(f"\n{format_error(e)}\n")
+        return 1
+    except KeyboardInterrupt:
+        sys.stderr.write("\nInterrupted, continue with --resume\n")
+        return 130
+
+    return 0
@@ -0,0 +1,83 @@
+# Write buffer that collapses repeated upserts to the same primary key.
+# Available as `cratedb.UpsertBuffer`, and only loaded when first used.
+
+from cratedb import BULK_ROW_FAILED
+
+
+class UpsertBuffer:
+    """
+    Holds pending rows keyed by primary key, so repeated updates to the same
+    key are collapsed into one row, and sends them all as a single bulk
+    `INSERT ... ON CONFLICT DO UPDATE` request on `flush()`.
+
+    Rows are dicts of column name to value. When a key is already pending,
+    the new row replaces it, unless a `merge(pending_row, new_row)` function
+    is given. `merge` only combines rows while they are in the buffer: on
+    the server, each flushed row replaces every column of the stored row,
+    including whole OBJECT values. At most `max_keys` rows are held: putting
+    a new key into a full buffer flushes it first.
+    """
+
+    def __init__(self, crate, table, columns, key="id", max_keys=50, merge=None):
+        self.crate = crate
+        self.key = key
+        self.columns = columns
+        self.max_keys = max_keys
+        self.merge = merge
+        self.pending = {}
+
+        column_list = ", ".join(f'"{c}"' for c in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        updates = ", ".join(f'"{c}" = excluded."{c}"' for c in columns if c != key)
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        # MicroPython cannot compile adjacent f-strings, so build the
+        # statement with a single one.
+        insert = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})"
+        conflict = f'ON CONFLICT ("{key}") {action}'
+        self.sql = f"{insert} {conflict}"
+
+    def __len__(self):
+        return len(self.pending)
+
+    def put(self, row):
+        """
+        Add `row` to the buffer. Returns the failures of the flush this
+        triggered, or `None` if there was none.
+        """
+        row_key = row[self.key]
+        is_pending = row_key in self.pending
+
+        if is_pending and self.merge is not None:
+            row = self.merge(self.pending[row_key], row)
+
+        for column in self.columns:
+            if column not in row:
+                raise ValueError(f"Row for {self.key} {row_key} has no column {column}")
+
+        failures = None
+        if not is_pending and len(self.pending) >= self.max_keys:
+            failures = self.flush()
+
+        self.pending[row_key] = row
+        return failures
+
+    def flush(self):
+        """
+        Send all pending rows in one bulk request. Returns a dict of key to
+        bulk result for each row CrateDB failed to write. Rows stay pending
+        if the request itself fails.
+        """
+        if not self.pending:
+            return {}
+
+        keys = list(self.pending)
+        response = self.crate.execute(
+            self.sql, [[self.pending[k][c] for c in self.columns] for k in keys]
+        )
+        self.pending = {}
+
+        failures = {}
+        for row_key, result in zip(keys, response["results"]):
+            if result["rowcount"] == BULK_ROW_FAILED:
+                failures[row_key] = result
+        return failures
@@ -0,0 +1,85 @@
+# Measures how long `import cratedb` takes and how much memory it
+# allocates, then does the same for loading the HTTP transport and the
+# constants. Runs on MicroPython (desktop or device), where it also
+# reports the free heap, and on CPython, where allocations are traced
+# with `tracemalloc`.
+#
+# Run it before and after a change to the driver, or compare the
+# `.py` module with a precompiled `.mpy` build, see
+# `docs/micropython.md`.
+
+import gc
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+try:
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:
+
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(end, start):
+        return end - start
+
+
+def mem_used():
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()[0]
+    return gc.mem_alloc()
+
+
+def mem_free():
+    return gc.mem_free() if hasattr(gc, "mem_free") else None
+
+
+if tracemalloc is not None:
+    tracemalloc.start()
+
+gc.collect()
+used_before = mem_used()
+start = ticks_us()
+
+import cratedb  # noqa: E402
+
+elapsed = ticks_diff(ticks_us(), start)
+gc.collect()
+used_after = mem_used()
+
+print(f"Import time: {elapsed} us")
+print(f"Memory used by import: {used_after - used_before} bytes")
+if mem_free() is not None:
+    print(f"Free heap after import: {mem_free()} bytes")
+
+# The first request loads the HTTP transport.
+if hasattr(cratedb, "_get_requests"):
+    gc.collect()
+    used_before = mem_used()
+    start = ticks_us()
+    cratedb._get_requests()
+    elapsed = ticks_diff(ticks_us(), start)
+    gc.collect()
+    used_after = mem_used()
+
+    print(f"Transport load time: {elapsed} us")
+    print(f"Memory used by transport: {used_after - used_before} bytes")
+
+# Accessing a constant loads `cratedb_constants` on demand.
+gc.collect()
+used_before = mem_used()
+start = ticks_us()
+type_text = cratedb.CRATEDB_TYPE_TEXT
+elapsed = ticks_diff(ticks_us(), start)
+gc.collect()
+used_after = mem_used()
+
+print(f"Constants load time: {elapsed} us")
+print(f"Memory used by constants: {used_after - used_before} bytes")
+print(f"CRATEDB_TYPE_TEXT: {type_text}")
+if mem_free() is not None:
+    print(f"Free heap after first use: {mem_free()} bytes")
@@ -0,0 +1,100 @@
+# Example script showing how to use `UpsertBuffer` to collapse
+# frequent updates to the same rows into a single bulk request.
+# This has no hardware dependencies so should run in any MicroPython
+# environment. You will need to edit the code below to use your
+# CrateDB credentials.
+
+import cratedb
+
+# CrateDB Docker / local network, no SSL.
+crate = cratedb.CrateDB(host="localhost", use_ssl=False)
+
+# CrateDB Cloud, using SSL.
+"""
+crate = cratedb.CrateDB(
+    host="testdrive.cratedb.net",
+    user="username",
+    password="password"
+)
+"""
+
+
+def merge_data(pending_row, new_row):
+    # Combine the OBJECT column of both rows, instead of replacing it.
+    data = pending_row["data"].copy()
+    data.update(new_row["data"])
+    return {"id": new_row["id"], "data": data}
+
+
+try:
+    print("Drop any previous table.")
+    crate.execute("DROP TABLE IF EXISTS driver_upsert_test", return_response=False)
+
+    print("Create table.")
+    response = crate.execute(
+        """CREATE TABLE driver_upsert_test (
+            id TEXT PRIMARY KEY,
+            data OBJECT(DYNAMIC) NOT NULL
+        )"""
+    )
+    print(response)
+
+    buffer = cratedb.UpsertBuffer(
+        crate, "driver_upsert_test", ["id", "data"], max_keys=10, merge=merge_data
+    )
+
+    # Many updates to the same two devices are held as two pending rows.
+    print("Buffer device state updates.")
+    for i in range(20):
+        buffer.put({"id": "2cae54", "data": {"uptime": i}})
+        buffer.put({"id": "3fb7a1", "data": {"temp": 20 + i / 10}})
+    buffer.put({"id": "2cae54", "data": {"battery_percentage": 57}})
+    print(f"Pending rows: {len(buffer)}")
+
+    # Send one INSERT ... ON CONFLICT (id) DO UPDATE bulk request.
+    print("Flush buffer.")
+    failures = buffer.flush()
+
+    # Flush failures: {}
+    print(f"Flush failures: {failures}")
+
+    crate.execute("REFRESH TABLE driver_upsert_test", return_response=False)
+
+    print("SELECT the updated rows.")
+    response = crate.execute("SELECT id, data FROM driver_upsert_test ORDER BY id")
+
+    # response:
+    # {'rows': [['2cae54', {'battery_percentage': 57, 'uptime': 19}],
+    #           ['3fb7a1', {'temp': 21.9}]],
+    #  'rowcount': 2, 'cols': ['id', 'data'], 'duration': 2.1347}
+    print(response)
+
+    # Merged data: [('battery_percentage', 57), ('uptime', 19)]
+    print(f"Merged data: {sorted(response['rows'][0][1].items())}")
+
+    # A full buffer is flushed when a row with a new key is put, and `put`
+    # returns the keys CrateDB failed to write in that flush. Here, the
+    # second row violates the NOT NULL constraint on `data`.
+    print("Fill a small buffer.")
+    small_buffer = cratedb.UpsertBuffer(
+        crate, "driver_upsert_test", ["id", "data"], max_keys=2
+    )
+    small_buffer.put({"id": "4d21c0", "data": {"uptime": 1}})
+    small_buffer.put({"id": "5e9f13", "data": None})
+    failures = small_buffer.put({"id": "6a0b77", "data": {"uptime": 2}})
+
+    # Auto-flush failures: {'5e9f13': {'rowcount': -2}}
+    # Pending after auto-flush: 1
+    print(f"Auto-flush failures: {failures}")
+    print(f"Pending after auto-flush: {len(small_buffer)}")
+
+    print("Drop table...")
+    response = crate.execute("DROP TABLE driver_upsert_test")
+    print(response)
+
+except cratedb.NetworkError as e:
+    print("Caught NetworkError:")
+    print(e)
+except cratedb.CrateDBError as c:
+    print("Caught CrateDBError:")
+    print(c)
@@ -1,5 +1,6 @@
 # ruff: noqa: S603, S607
 
+import json
 import os
 import subprocess
 from pathlib import Path
@@ -38,6 +39,22 @@ def test_object_examples(capfd):
     assert "Drop table" in out
 
 
+def test_upsert_buffer(capfd):
+    """
+    Validate `examples/upsert_buffer.py` coalesces and merges updates, flushes
+    a full buffer on a new key, and reports per-key failures.
+    """
+    subprocess.check_call(["python", "examples/upsert_buffer.py"])
+    out, err = capfd.readouterr()
+    assert "Create table" in out
+    assert "Pending rows: 2" in out
+    assert "Flush failures: {}" in out
+    assert "Merged data: [('battery_percentage', 57), ('uptime', 19)]" in out
+    assert "Auto-flush failures: {'5e9f13': {'rowcount': -2" in out
+    assert "Pending after auto-flush: 1" in out
+    assert "Drop table" in out
+
+
 def test_picow_demo(capfd):
     """
     Validate `examples/picow_demo.py` fails, because it needs real hardware.
@@ -46,3 +63,190 @@ def test_picow_demo(capfd):
     assert returncode == 1
     out, err = capfd.readouterr()
     assert "ModuleNotFoundError: No module named 'machine'" in err
+
+
+def test_import_footprint(capfd):
+    """
+    Validate `examples/import_footprint.py` runs to completion.
+    """
+    subprocess.check_call(["python", "examples/import_footprint.py"])
+    out, err = capfd.readouterr()
+    assert "Import time" in out
+    assert "Memory used by import" in out
+    assert "CRATEDB_TYPE_TEXT: 4" in out
+
+
+def test_import_is_lazy():
+    """
+    Validate `import cratedb` defers loading the transport, constants, and
+    `UpsertBuffer`.
+    """
+    script = """
+import sys
+import cratedb
+lazy = ["requests", "urequests", "base64", "cratedb_constants", "cratedb_upsert"]
+assert not [name for name in lazy if name in sys.modules]
+assert cratedb.CRATEDB_TYPE_TEXT == 4
+assert "cratedb_constants" in sys.modules
+assert cratedb.UpsertBuffer.__module__ == "cratedb_upsert"
+assert "CRATEDB_ERROR_UNKNOWN_COLUMN" in dir(cratedb)
+assert "UpsertBuffer" in dir(cratedb)
+from cratedb import CRATEDB_ERROR_UNKNOWN_COLUMN
+assert CRATEDB_ERROR_UNKNOWN_COLUMN == 4043
+"""
+    subprocess.check_call(["python", "-c", script])
+
+
+CLI = ["python", "-m", "cratedb", "--no-ssl"]
+CLI_SELECT = "SELECT id, value, note, data, tags FROM cli_test ORDER BY id"
+
+
+def create_cli_test_table():
+    """
+    Create and fill the `cli_test` table, and return its rows.
+    """
+    import cratedb
+
+    crate = cratedb.CrateDB(host="localhost", use_ssl=False)
+    crate.execute("DROP TABLE IF EXISTS cli_test")
+    crate.execute(
+        """
+        CREATE TABLE cli_test (
+            id INTEGER PRIMARY KEY,
+            value INTEGER,
+            note TEXT,
+            data OBJECT(DYNAMIC),
+            tags ARRAY(TEXT)
+        )
+        """
+    )
+    # TEXT values that look like JSON, the NULL marker, or an escape.
+    notes = ['{"a": 1}', "[1, 2]", "\\N", "\\x", "", "plain", None]
+    crate.execute(
+        "INSERT INTO cli_test (id, value, note, data, tags) VALUES (?, ?, ?, ?, ?)",
+        [
+            [
+                i,
+                None if i % 3 == 0 else i * 10,
+                notes[i % len(notes)],
+                {"value": i},
+                ["a", str(i)],
+            ]
+            for i in range(25)
+        ],
+    )
+    crate.execute("REFRESH TABLE cli_test")
+    return crate, crate.execute(CLI_SELECT)["rows"]
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "csv"])
+def test_cli_export_import(tmp_path, extension):
+    """
+    Validate `python -m cratedb` round-trips a table through a JSON lines
+    or CSV file, including NULL, TEXT, OBJECT, and ARRAY values.
+    """
+    crate, expected = create_cli_test_table()
+
+    export_file = tmp_path / f"cli_test.{extension}"
+    subprocess.check_call(
+        [*CLI, "export", CLI_SELECT, str(export_file), "--page-size=10"]
+    )
+
+    crate.execute("DELETE FROM cli_test")
+    crate.execute("REFRESH TABLE cli_test")
+    subprocess.check_call(
+        [
+            *CLI,
+            "import",
+            "cli_test",
+            str(export_file),
+            "--batch-size=4",
+            "--parallelism=3",
+        ]
+    )
+    crate.execute("REFRESH TABLE cli_test")
+    response = crate.execute(CLI_SELECT)
+    crate.execute("DROP TABLE cli_test")
+    assert response["rows"] == expected
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "csv"])
+def test_cli_resume(tmp_path, extension):
+    """
+    Validate `--resume` continues from the last committed offset, without
+    repeating rows or the CSV header.
+    """
+    crate, expected = create_cli_test_table()
+
+    export_file = tmp_path / f"cli_test.{extension}"
+    export = [*CLI, "export", CLI_SELECT, str(export_file), "--page-size=10"]
+    subprocess.check_call(export)
+    lines = export_file.read_text().splitlines(keepends=True)
+
+    # Pretend the export stopped after the first page.
+    header = 1 if extension == "csv" else 0
+    export_file.write_text("".join(lines[: header + 10]))
+    (tmp_path / f"cli_test.{extension}.export.offset").write_text('{"offset": 10}')
+    subprocess.check_call([*export, "--resume"])
+    assert export_file.read_text().splitlines(keepends=True) == lines
+
+    # Pretend the import stopped after the first ten rows.
+    crate.execute("DELETE FROM cli_test")
+    crate.execute("REFRESH TABLE cli_test")
+    (tmp_path / f"cli_test.{extension}.import.offset").write_text('{"offset": 10}')
+    subprocess.check_call(
+        [*CLI, "import", "cli_test", str(export_file), "--batch-size=4", "--resume"]
+    )
+    crate.execute("REFRESH TABLE cli_test")
+    response = crate.execute(CLI_SELECT)
+    crate.execute("DROP TABLE cli_test")
+    assert response["rows"] == expected[10:]
+
+
+def test_cli_import_rejects(tmp_path):
+    """
+    Validate rows rejected by CrateDB are reported with their offset.
+    """
+    crate, _ = create_cli_test_table()
+
+    # The second row duplicates an existing primary key.
+    import_file = tmp_path / "rejects.jsonl"
+    import_file.write_text('{"id": 100}\n{"id": 5}\n{"id": 101}\n')
+    returncode = subprocess.call([*CLI, "import", "cli_test", str(import_file)])
+    crate.execute("REFRESH TABLE cli_test")
+    response = crate.execute("SELECT id FROM cli_test WHERE id >= 100 ORDER BY id")
+    crate.execute("DROP TABLE cli_test")
+
+    assert returncode == 1
+    assert response["rows"] == [[100], [101]]
+    rejects = (tmp_path / "rejects.jsonl.import.rejects").read_text().splitlines()
+    assert len(rejects) == 1
+    reject = json.loads(rejects[0])
+    assert reject["offset"] == 1
+    assert reject["row"] == {"id": 5}
+    assert reject["result"]["rowcount"] == -2
+
+
+def test_cli_errors(tmp_path):
+    """
+    Validate unreadable and malformed input is reported without a traceback.
+    """
+    missing = subprocess.run(
+        [*CLI, "import", "cli_test", str(tmp_path / "missing.jsonl")],
+        capture_output=True,
+        text=True,
+    )
+    assert missing.returncode == 1
+    assert "FileNotFoundError" in missing.stderr
+    assert "Traceback" not in missing.stderr
+
+    malformed_file = tmp_path / "malformed.jsonl"
+    malformed_file.write_text('{"id": 1}\n{oops\n')
+    malformed = subprocess.run(
+        [*CLI, "import", "cli_test", str(malformed_file)],
+        capture_output=True,
+        text=True,
+    )
+    assert malformed.returncode == 1
+    assert "line 2" in malformed.stderr
+    assert "Traceback" not in malformed.stderr
@@ -16,6 +16,33 @@ def object_examples():
     assert os.system("micropython examples/object_examples.py") == 0
 
 
+def upsert_buffer():
+    """
+    Validate `examples/upsert_buffer.py` coalesces and merges updates, flushes
+    a full buffer on a new key, and reports per-key failures.
+    """
+    assert (
+        os.system("micropython examples/upsert_buffer.py > /tmp/upsert_buffer.txt") == 0
+    )
+    for expected in [
+        "Pending rows: 2",
+        "Flush failures: {}",
+        "Merged data: [('battery_percentage', 57), ('uptime', 19)]",
+        "Auto-flush failures: {'5e9f13': {'rowcount': -2",
+        "Pending after auto-flush: 1",
+    ]:
+        assert os.system(f'grep -qF "{expected}" /tmp/upsert_buffer.txt') == 0
+
+
+def import_footprint():
+    """
+    Validate `examples/import_footprint.py` runs to completion.
+    """
+    assert os.system("micropython examples/import_footprint.py") == 0
+
+
 if __name__ == "__main__":
     example_usage()
     object_examples()
+    upsert_buffer()
+    import_footprint()